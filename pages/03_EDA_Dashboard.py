@@ -9,6 +9,7 @@ st.set_page_config(
 
 import pandas as pd
 import numpy as np
+import uuid
 import plotly.express as px
 import plotly.graph_objects as go
 from utils.data_analyzer import (
@@ -604,11 +605,16 @@ if tab_info["Full Report"]["available"]:
         # Generate a comprehensive EDA report
         with st.spinner("Generating EDA report..."):
             try:
-                # Create a copy of the dataframe with fixed column names for the report
-                report_df = df.copy()
+                # Give each working dataset a fresh report cache token, so the report is
+                # reused across reruns without hashing the frame
+                if st.session_state.get("_eda_report_frame") is not df:
+                    st.session_state["_eda_report_frame"] = df
+                    st.session_state["_eda_report_token"] = uuid.uuid4().hex
+                report_key = (st.session_state.get("dataset_id"), st.session_state["_eda_report_token"])
                 
-                # Generate HTML report (returned as base64)
-                report_html_base64 = generate_quick_eda_report(report_df)
+                # Generate HTML report (returned as base64); the analyzers only read df,
+                # so no copy is needed and a cache hit costs nothing
+                report_html_base64 = generate_quick_eda_report(df, cache_key=report_key)
                 
                 # Initialize report_html as None
                 report_html = None
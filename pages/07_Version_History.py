@@ -11,7 +11,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import json
-from utils.database import get_versions, get_version, get_dataset, save_version, get_transformations
+from utils.database import get_versions, get_version, get_versions_data, get_dataset, save_version, get_transformations
 from utils.export import generate_excel_download_link, generate_csv_download_link
 from utils.auth_redirect import require_auth
 from utils.custom_navigation import render_navigation, initialize_navigation
@@ -220,13 +220,10 @@ if versions:
                 format_func=lambda i: f"Version {other_versions[i]['version']} - {other_versions[i]['name']} ({other_versions[i]['created_at']})"
             )
             
-            # Get the data for both versions
-            version_data = get_version(version['id'])
-            compare_data = get_version(other_versions[compare_version]['id'])
+            # Get the data for both versions in one round trip
+            version_df, compare_df = get_versions_data([version['id'], other_versions[compare_version]['id']])
             
-            if version_data and 'dataset' in version_data and version_data['dataset'] is not None and compare_data and 'dataset' in compare_data and compare_data['dataset'] is not None:
-                version_df = version_data['dataset']
-                compare_df = compare_data['dataset']
+            if version_df is not None and compare_df is not None:
                 
                 # Display comparison
                 st.subheader("Structure Comparison")
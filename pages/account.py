@@ -1,6 +1,6 @@
 import streamlit as st
 import hashlib
-from utils.database import get_user_by_id, execute_with_retry
+from utils.database import get_user_by_id, execute_with_retry, invalidate_user_cache
 from utils.subscription import SUBSCRIPTION_PLANS, format_price, get_trial_days_remaining, get_subscription_expires_in_days
 from sqlalchemy import text
 from utils.global_config import apply_global_css, render_footer
@@ -61,6 +61,7 @@ def update_password(user_id, current_password, new_password):
                 )
             )
             session.commit()
+            invalidate_user_cache(user_id)
             return {'success': True}
         except Exception as e:
             session.rollback()
@@ -90,6 +91,7 @@ def update_profile(user_id, full_name, email):
                 )
             )
             session.commit()
+            invalidate_user_cache(user_id)
             return {'success': True}
         except Exception as e:
             session.rollback()
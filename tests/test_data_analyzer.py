@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from utils.data_analyzer import analyze_column_correlations, generate_quick_eda_report
+
+
+def test_spearman_correlations_without_missing_values():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(100, 3)), columns=['a', 'b', 'c'])
+    df['c'] = df['a'] * 2 + rng.normal(scale=0.01, size=100)
+
+    result = analyze_column_correlations(df, method='spearman')
+
+    pd.testing.assert_frame_equal(result['correlation_matrix'], df.corr(method='spearman'))
+    assert [(r['column1'], r['column2']) for r in result['strong_correlations']] == [('a', 'c')]
+
+
+def test_quick_eda_report_leaves_input_unchanged():
+    df = pd.DataFrame({
+        'x': [1.0, 2.0, 3.0, 100.0],
+        'y': [2.0, 4.0, 6.0, 8.0],
+        'label': ['a', 'b', 'a', 'a'],
+    })
+    before = df.copy()
+
+    assert generate_quick_eda_report(df)
+
+    pd.testing.assert_frame_equal(df, before)
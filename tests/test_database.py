@@ -0,0 +1,80 @@
+import gc
+import io
+
+import numpy as np
+import pandas as pd
+
+import utils.database as database
+from utils.database import deserialize_dataframe, serialize_dataframe
+
+
+def _sample_frame():
+    return pd.DataFrame({
+        'a': [1, 2, 3],
+        'b': [1.5, np.nan, 2.0],
+        's': ['x', 'y', 'x'],
+        'n': pd.array([1, None, 3], dtype='Int64'),
+    })
+
+
+def _assert_writable(df):
+    df.iloc[0, 0] = 9
+    df.iloc[0, 1] = 3.0
+    df.iloc[0, 2] = 'z'
+    df.iloc[0, 3] = 4
+    assert df.iloc[0].tolist() == [9, 3.0, 'z', 4]
+
+
+def test_round_trip_returns_writable_frame():
+    df = _sample_frame()
+
+    result = deserialize_dataframe(serialize_dataframe(df))
+
+    pd.testing.assert_frame_equal(result, df)
+    _assert_writable(result)
+
+
+def test_legacy_parquet_blob_returns_writable_frame():
+    df = _sample_frame()
+    buffer = io.BytesIO()
+    df.to_parquet(buffer)
+
+    result = deserialize_dataframe(buffer.getvalue())
+
+    pd.testing.assert_frame_equal(result, df)
+    _assert_writable(result)
+
+
+def test_save_version_reuses_blob_of_unmodified_dataset_frame(monkeypatch):
+    database.metadata.create_all(database.engine)
+    calls = []
+    real_serialize = database.serialize_dataframe
+    monkeypatch.setattr(database, 'serialize_dataframe', lambda df: calls.append(df) or real_serialize(df))
+    df = _sample_frame()
+
+    dataset_id = database.save_dataset('reuse', '', 'f.csv', 'csv', df, {}, user_id=1)
+    version_id = database.save_version(dataset_id, 1, 'v1', '', df, [])
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(database.get_version(version_id)['dataset'], df)
+
+    # The blob is reused once only, and never for a frame edited in place
+    database.save_dataset('reuse', '', 'f.csv', 'csv', df.assign(a=[7, 8, 9]), {}, user_id=1)
+    database.save_version(dataset_id, 2, 'v2', '', df, [])
+    df2 = df.assign(a=[4, 5, 6])
+    database.save_dataset('reuse', '', 'f.csv', 'csv', df2, {}, user_id=1)
+    df2.iloc[0, 0] = 100
+    v3 = database.save_version(dataset_id, 3, 'v3', '', df2, [])
+
+    assert len(calls) == 5
+    assert database.get_version(v3)['dataset'].iloc[0, 0] == 100
+
+
+def test_remembered_blob_is_dropped_with_its_frame():
+    df = _sample_frame()
+    database._remember_blob(df, 'hash', b'blob')
+
+    del df
+    gc.collect()
+
+    assert database._last_saved_blob is None
@@ -1,10 +1,11 @@
 import streamlit as st
 import json
+import orjson
 import os
 import datetime
 import pandas as pd
 import numpy as np
-from utils.database import execute_with_retry
+from utils.database import execute_with_retry, json_dumps
 from sqlalchemy import text
 import pickle
 
@@ -96,7 +97,7 @@ def save_user_feedback(feedback_type, content_id, rating, comment=None, original
             "comment": comment,
             "original_prompt": original_prompt,
             "original_response": original_response,
-            "metadata": json.dumps(metadata) if metadata else None
+            "metadata": json_dumps(metadata) if metadata else None
         }
         
         from utils.database import engine
@@ -137,7 +138,7 @@ def save_transformation_outcome(dataset_hash, column_name, original_values, tran
             "transformed_values": transformed_values,
             "transformation_type": transformation_type,
             "result_quality": result_quality,
-            "metadata": json.dumps(metadata) if metadata else None
+            "metadata": json_dumps(metadata) if metadata else None
         }
         
         from utils.database import engine
@@ -184,7 +185,7 @@ def save_learning_preference(preference_type, preference_value):
         params = {
             "user_id": user_id,
             "preference_type": preference_type,
-            "preference_value": json.dumps(preference_value)
+            "preference_value": json_dumps(preference_value)
         }
         
         from utils.database import engine
@@ -223,8 +224,8 @@ def get_user_preferences():
                     preferences[row[0]] = row[1]
                 else:
                     try:
-                        preferences[row[0]] = json.loads(row[1])
-                    except (TypeError, json.JSONDecodeError):
+                        preferences[row[0]] = orjson.loads(row[1])
+                    except (TypeError, orjson.JSONDecodeError):
                         # If there's an error, store as-is or an empty dict
                         preferences[row[0]] = {} if row[1] is None else row[1]
             return preferences
@@ -279,11 +280,11 @@ def get_similar_transformations(column_name, sample_values, transformation_type,
                 transformations.append({
                     "dataset_hash": row[0],
                     "column_name": row[1],
-                    "original_values": json.loads(row[2]) if row[2] else None,
-                    "transformed_values": json.loads(row[3]) if row[3] else None,
+                    "original_values": orjson.loads(row[2]) if row[2] else None,
+                    "transformed_values": orjson.loads(row[3]) if row[3] else None,
                     "transformation_type": row[4],
                     "result_quality": row[5],
-                    "metadata": json.loads(row[6]) if row[6] else None
+                    "metadata": orjson.loads(row[6]) if row[6] else None
                 })
             return transformations
     
@@ -1,8 +1,12 @@
 import streamlit as st
 import json
 import base64
+import time
+import logging
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 def get_cookie_token():
     """Get auth token from cookies if available."""
     try:
@@ -11,9 +15,8 @@ def get_cookie_token():
             encoded_token = st.query_params["analytics_assist_auth"]
             token_data = json.loads(base64.b64decode(encoded_token).decode())
             
-            # Check token expiration
-            expiry = datetime.fromisoformat(token_data["expiry"])
-            if datetime.now() < expiry:
+            # Check token expiration (stored as an epoch timestamp)
+            if time.time() < token_data["expiry"]:
                 # Valid token, update session state
                 st.session_state.logged_in = True
                 st.session_state.user_id = token_data["user_id"]
@@ -27,7 +30,7 @@ def get_cookie_token():
                 
                 return True
     except Exception as e:
-        print(f"Error parsing auth token: {str(e)}")
+        logger.debug("Error parsing auth token: %s", e)
     
     return False
 
@@ -41,7 +44,7 @@ def set_auth_cookie():
                 "email": st.session_state.user_email,
                 "name": st.session_state.user_name,
                 "subscription": st.session_state.user_subscription,
-                "expiry": (datetime.now() + timedelta(days=7)).isoformat()
+                "expiry": int((datetime.now() + timedelta(days=7)).timestamp())
             }
             
             # Convert to base64 encoded JSON
@@ -72,7 +75,7 @@ def set_auth_cookie():
             st.markdown(script, unsafe_allow_html=True)
             return True
         except Exception as e:
-            print(f"Error setting auth cookie: {str(e)}")
+            logger.debug("Error setting auth cookie: %s", e)
     
     return False
 
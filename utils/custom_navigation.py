@@ -1,5 +1,7 @@
 import streamlit as st
 import os
+import html
+import string
 import base64
 from datetime import datetime
 
@@ -15,171 +17,217 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def render_navigation():
-    """Render the navigation bar in the sidebar."""
-    # Get navigation items based on role
-    nav_items = get_navigation_items()
-    
-    # Current page from session state
-    current_page = st.session_state.get("current_page", "/")
-    
- 
-    
-    # App title with gradient
-    st.sidebar.markdown(
-        """
-        <div style="
-            background: linear-gradient(90deg, #4b6cb7 0%, #182848 100%);
-            padding: 10px 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        ">
-            <h1 style="
-                color: white;
-                margin: 0;
-                font-size: 26px;
-                font-weight: 700;
-                text-align: center;
-                letter-spacing: 0.5px;
-            ">Analytics Assist</h1>
-        </div>
-        """, 
-        unsafe_allow_html=True
-    )
-    
-    # User profile section if logged in
-    if st.session_state.get("logged_in", False):
-        user = st.session_state.get("user", {})
-        subscription_tier = st.session_state.get("subscription_tier", "free")
+# The base path is fixed for the lifetime of the process; for the root page, use "/"
+_DEFAULT_PAGE = os.environ.get("STREAMLIT_SERVER_BASE_PATH_INFO") or "/"
+
+# Static sidebar HTML, built once at import instead of on every rerun
+_TITLE_HTML = """
+    <div style="
+        background: linear-gradient(90deg, #4b6cb7 0%, #182848 100%);
+        padding: 10px 15px;
+        border-radius: 8px;
+        margin-bottom: 20px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    ">
+        <h1 style="
+            color: white;
+            margin: 0;
+            font-size: 26px;
+            font-weight: 700;
+            text-align: center;
+            letter-spacing: 0.5px;
+        ">Analytics Assist</h1>
+    </div>
+"""
+
+_NAV_CSS = """
+    <style>
+        div[data-testid="stSidebarNavItems"] ul {
+            padding-left: 0;
+            list-style-type: none;
+        }
+        
+        div[data-testid="stSidebarNavItems"] li {
+            margin-bottom: 0.5rem;
+        }
         
-        # Check if on trial
-        trial_days = 0
-        is_trial = False
-        if user.get("is_trial", False):
-            trial_days = get_trial_days_remaining()
-            is_trial = trial_days > 0
+        div[data-testid="stSidebarNavItems"] a {
+            text-decoration: none;
+            color: #31333F;
+            font-size: 1rem;
+            display: block;
+            padding: 0.5rem 0.75rem;
+            border-radius: 0.375rem;
+            transition: all 0.15s ease;
+        }
         
-        # Format subscription tier display
-        tier_display = subscription_tier.capitalize()
-        if is_trial:
-            tier_display = f"Pro (Trial: {trial_days} days left)"
+        div[data-testid="stSidebarNavItems"] a:hover {
+            background-color: rgba(128, 128, 128, 0.1);
+        }
         
-        # Determine the background color based on trial status
-        bg_color = "#4CAF50" if is_trial else "#3b82f6"
+        div[data-testid="stSidebarNavItems"] a.sidebar-nav-item-active {
+            background-color: rgba(128, 128, 128, 0.15);
+            font-weight: 600;
+            color: #0F52BA;
+            border-left: 3px solid #0F52BA;
+        }
         
-        # Use string concatenation instead of f-strings for the HTML to avoid syntax errors
-        profile_html = """
-        <div style="
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-            border: 1px solid rgba(0, 0, 0, 0.05);
-        ">
-            <div style="display: flex; align-items: center; margin-bottom: 10px;">
-                <div style="font-weight: 600; font-size: 16px;">
-                    Welcome, """ + user.get('full_name', 'User') + """
-                </div>
-            </div>
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div style="
-                    background: """ + bg_color + """;
-                    color: white;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-size: 12px;
-                    display: inline-block;
-                ">""" + tier_display + """</div>
-                <div id="account-link-container"></div>
-            </div>
-        </div>
-        """
+        div[data-testid="stSidebarNavItems"] a div {
+            display: flex;
+            align-items: center;
+        }
         
-        st.sidebar.markdown(profile_html, unsafe_allow_html=True)
+        div[data-testid="stSidebarNavItems"] a div svg {
+            margin-right: 0.75rem;
+        }
         
-        # Add a manage account button
-        if st.sidebar.button("Manage Account", key="manage_account_button"):
-            st.switch_page("pages/account.py")
+        /* Hide replit domain url in stStatusWidget */
+        [data-testid="stStatusWidget"] {
+            display: none !important;
+        }
+    </style>
+"""
+
+# User profile card, filled in per user with substitute()
+_PROFILE_TPL = string.Template("""
+    <div style="
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 8px;
+        padding: 15px;
+        margin-bottom: 20px;
+        border: 1px solid rgba(0, 0, 0, 0.05);
+    ">
+        <div style="display: flex; align-items: center; margin-bottom: 10px;">
+            <div style="font-weight: 600; font-size: 16px;">
+                Welcome, $name
+            </div>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div style="
+                background: $bg_color;
+                color: white;
+                border-radius: 4px;
+                padding: 4px 8px;
+                font-size: 12px;
+                display: inline-block;
+            ">$tier_display</div>
+            <div id="account-link-container"></div>
+        </div>
+    </div>
+""")
+
+_FOOTER_HTML = """
+    <div style="
+        margin-top: 40px;
+        padding-top: 10px;
+        border-top: 1px solid rgba(128, 128, 128, 0.2);
+        font-size: 0.8rem;
+        opacity: 0.7;
+        text-align: center;
+    ">
+        <p>© 2025 Analytics Assist</p>
+    </div>
+"""
+
+# Header shown to logged-out visitors, identical across all sessions
+_ANON_HEADER_HTML = _NAV_CSS + _TITLE_HTML
+
+def _get_cached_navigation_items(logged_in):
+    """Return navigation items, rebuilding them only when the user's role changes."""
+    nav_key = (
+        logged_in,
+        st.session_state.get("subscription_tier", "free"),
+        st.session_state.get("is_admin", False),
+        is_developer_mode(),
+    )
+    if st.session_state.get("_nav_items_key") != nav_key:
+        nav_items = get_navigation_items()
+        # Resolve each link target once here rather than on every render
+        for item in nav_items:
+            url = item.get('url', '#')
+            # Handle the home page specially
+            item['_page'] = None if url == '#' else "app.py" if url == '/' else url.lstrip('/')
+        st.session_state["_nav_items"] = nav_items
+        st.session_state["_nav_items_key"] = nav_key
+    return st.session_state["_nav_items"]
+
+def _render_nav_links(nav_items):
+    """Render the navigation as native page links, which switch pages without a script rerun."""
+    for item in nav_items:
+        if item['_page']:
+            st.sidebar.page_link(item['_page'], label=item.get('name', 'Link'), use_container_width=True)
+
+def _get_sidebar_header_html(logged_in):
+    """Return the sidebar header HTML, rebuilding it only when its inputs change."""
+    # Anonymous visitors all share the same header
+    if not logged_in:
+        return _ANON_HEADER_HTML
     
-    # Navigation Items
-    st.sidebar.markdown("""
-        <style>
-            div[data-testid="stSidebarNavItems"] ul {
-                padding-left: 0;
-                list-style-type: none;
-            }
-            
-            div[data-testid="stSidebarNavItems"] li {
-                margin-bottom: 0.5rem;
-            }
-            
-            div[data-testid="stSidebarNavItems"] a {
-                text-decoration: none;
-                color: #31333F;
-                font-size: 1rem;
-                display: block;
-                padding: 0.5rem 0.75rem;
-                border-radius: 0.375rem;
-                transition: all 0.15s ease;
-            }
-            
-            div[data-testid="stSidebarNavItems"] a:hover {
-                background-color: rgba(128, 128, 128, 0.1);
-            }
-            
-            div[data-testid="stSidebarNavItems"] a.sidebar-nav-item-active {
-                background-color: rgba(128, 128, 128, 0.15);
-                font-weight: 600;
-                color: #0F52BA;
-                border-left: 3px solid #0F52BA;
-            }
-            
-            div[data-testid="stSidebarNavItems"] a div {
-                display: flex;
-                align-items: center;
-            }
-            
-            div[data-testid="stSidebarNavItems"] a div svg {
-                margin-right: 0.75rem;
-            }
-            
-            /* Hide replit domain url in stStatusWidget */
-            [data-testid="stStatusWidget"] {
-                display: none !important;
-            }
-        </style>
-    """, unsafe_allow_html=True)
+    user = st.session_state.get("user", {})
+    subscription_tier = st.session_state.get("subscription_tier", "free")
+    
+    # Check if on trial
+    trial_days = 0
+    is_trial = False
+    if user.get("is_trial", False):
+        trial_days = get_trial_days_remaining()
+        is_trial = trial_days > 0
+    
+    # Key on the values the card displays, so a tier or trial change shows immediately
+    header_hash = hash((user.get("full_name"), subscription_tier, trial_days))
+    if st.session_state.get("_nav_header_hash") == header_hash:
+        return st.session_state["_nav_header_html"]
+    
+    # Format subscription tier display
+    tier_display = subscription_tier.capitalize()
+    if is_trial:
+        tier_display = f"Pro (Trial: {trial_days} days left)"
+    
+    # Determine the background color based on trial status
+    bg_color = "#4CAF50" if is_trial else "#3b82f6"
+    
+    # Escape the user-supplied name since the card is rendered as raw HTML
+    profile_html = _PROFILE_TPL.substitute(
+        name=html.escape(user.get('full_name', 'User')),
+        bg_color=bg_color,
+        tier_display=html.escape(tier_display),
+    )
+    
+    header_html = _ANON_HEADER_HTML + profile_html
+    st.session_state["_nav_header_html"] = header_html
+    st.session_state["_nav_header_hash"] = header_hash
+    return header_html
+
+def render_navigation():
+    """Render the navigation bar in the sidebar."""
+    # Login state from session state, read once per render
+    logged_in = st.session_state.get("logged_in", False)
+    
+    # Get navigation items based on role
+    nav_items = _get_cached_navigation_items(logged_in)
+    
+    # Static chrome (nav CSS, title, profile card) is emitted as a single element
+    st.sidebar.markdown(_get_sidebar_header_html(logged_in), unsafe_allow_html=True)
+    
+    # Add a manage account button
+    if logged_in and st.sidebar.button("Manage Account", key="manage_account_button"):
+        st.switch_page("pages/account.py")
     
     # Use standard Streamlit navigation instead of custom HTML
-    for item in nav_items:
-        is_active = current_page == item.get("url", "#")
-        if st.sidebar.button(
-            item.get('name', 'Link'), 
-            key=f"nav_{item.get('name', 'link').lower().replace(' ', '_')}",
-            use_container_width=True,
-            type="primary" if is_active else "secondary"
-        ):
-            # When clicked, navigate to the page
-            url = item.get('url', '#')
-            # Handle the home page specially
-            if url == '/':
-                st.switch_page("app.py")
-            elif url != '#':
-                st.switch_page(url.lstrip('/'))
+    _render_nav_links(nav_items)
     
     # Logout button at bottom if logged in
-    if st.session_state.get("logged_in", False):
+    if logged_in:
         st.sidebar.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
         if st.sidebar.button("Logout", key="logout_button"):
-            # Clear session state
-            for key in list(st.session_state.keys()):
-                if key != "current_page":  # Keep current page for redirect
-                    del st.session_state[key]
+            # Clear session state in one pass, keeping current page for redirect
+            preserved = {"current_page": st.session_state.get("current_page", "/")}
+            st.session_state.clear()
+            st.session_state.update(preserved)
             
             st.sidebar.success("Logged out successfully")
             
@@ -187,18 +235,7 @@ def render_navigation():
             st.switch_page("app.py")
     
     # Footer with copyright
-    st.sidebar.markdown("""
-        <div style="
-            margin-top: 40px;
-            padding-top: 10px;
-            border-top: 1px solid rgba(128, 128, 128, 0.2);
-            font-size: 0.8rem;
-            opacity: 0.7;
-            text-align: center;
-        ">
-            <p>© 2025 Analytics Assist</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.sidebar.markdown(_FOOTER_HTML, unsafe_allow_html=True)
     
     # Add footer links as actual Streamlit buttons
     terms_col, privacy_col = st.sidebar.columns(2)
@@ -222,13 +259,4 @@ def logout_developer():
 
 def initialize_navigation():
     """Initialize the navigation by determining the current page."""
-    # Get the current page from the URL
-    current_url = os.environ.get("STREAMLIT_SERVER_BASE_PATH_INFO", "/")
-    
-    # For the root page, use "/"
-    if current_url == "" or current_url is None:
-        current_url = "/"
-    
-
-    
-   
+    st.session_state.setdefault("current_page", _DEFAULT_PAGE)
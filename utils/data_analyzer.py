@@ -3,68 +3,191 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from scipy import stats
 import json
 from datetime import datetime
 import io
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import Template
 
-def generate_summary_stats(df):
+__all__ = [
+    'generate_summary_stats',
+    'analyze_column_correlations',
+    'detect_outliers',
+    'generate_quick_eda_report',
+    'detect_skewness',
+    'analyze_categorical_distributions',
+]
+
+# Outlier scoring is split across threads once a frame has more numeric columns than this
+_PARALLEL_MIN_COLUMNS = 64
+_COLUMN_CHUNK = 16
+
+# Report layout; the tables themselves are rendered by DataFrame.to_html
+_REPORT_TEMPLATE = Template("""
+<html>
+<head>
+    <title>Dataset Profile Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1, h2, h3 { color: #2c3e50; }
+        .section { margin-bottom: 30px; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { text-align: left; padding: 8px; border-bottom: 1px solid #ddd; }
+        th { background-color: #f2f2f2; }
+        tr:hover { background-color: #f5f5f5; }
+        .stat-card {
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            padding: 15px;
+            margin-bottom: 15px;
+            background-color: #f9f9f9;
+        }
+    </style>
+</head>
+<body>
+    <h1>Dataset Profile Report</h1>
+    
+    <div class="section">
+        <h2>Dataset Overview</h2>
+        <div class="stat-card">
+            <p><strong>Rows:</strong> {{ rows }}</p>
+            <p><strong>Columns:</strong> {{ columns }}</p>
+        </div>
+    </div>
+    {% for title, table_html in sections %}
+    <div class="section">
+        <h2>{{ title }}</h2>
+        {{ table_html }}
+    </div>
+    {% endfor %}
+</body>
+</html>
+""")
+
+def _html_table(frame, **kwargs):
+    """Render a report table; styling comes from the template's CSS."""
+    return frame.to_html(index=False, border=0, justify='left', na_rep='N/A', **kwargs)
+
+def _categorize_repetitive(df, object_cols, sample_rows=10_000):
+    """Return df with highly repetitive string columns cast to category.
+    
+    The counting analyzers then hash each column once here and work on integer
+    codes afterwards. Categories keep first-appearance order so value-count
+    ties come out as they would on the original column. df is not modified.
+    """
+    if not df.columns.is_unique:
+        return df
+    sample = df.head(sample_rows)
+    repetitive = [
+        col for col in object_cols
+        if not isinstance(df[col].dtype, pd.CategoricalDtype)
+        and sample[col].nunique() < 0.5 * len(sample)
+    ]
+    if not repetitive:
+        return df
+    frame = df.copy(deep=False)
+    for col in repetitive:
+        codes, uniques = pd.factorize(df[col])
+        frame[col] = pd.Categorical.from_codes(codes, uniques)
+    return frame
+
+def _profile_context(df):
+    """Compute the column groupings and per-column counts shared by the analyzers.
+    
+    Building this once lets generate_quick_eda_report hand the same context to
+    every analyzer instead of each one re-deriving it from the DataFrame.
+    """
+    cat_cols = df.select_dtypes(exclude=['number', 'datetime']).columns
+    object_cols = df.select_dtypes(include=['category', 'object']).columns
+    return {
+        'numeric_cols': df.select_dtypes(include=['number']).columns,
+        'cat_cols': cat_cols,
+        'object_cols': object_cols,
+        'date_cols': df.select_dtypes(include=['datetime']).columns,
+        'na_counts': df.isna().sum(),
+    }
+
+def _frame(df, ctx):
+    """df with repetitive string columns categorized, built on first use.
+    
+    Only the counting analyzers need it, so the numeric ones never pay for
+    factorizing the string columns.
+    """
+    if 'frame' not in ctx:
+        ctx['frame'] = _categorize_repetitive(df, ctx['object_cols'])
+    return ctx['frame']
+
+def _nunique(df, ctx):
+    """Unique-value counts for the non-numeric columns, computed on first use."""
+    if 'nunique' not in ctx:
+        ctx['nunique'] = _frame(df, ctx)[ctx['cat_cols']].nunique()
+    return ctx['nunique']
+
+def _numeric_block(df, ctx):
+    """The numeric columns as one column-major float array, built on first use.
+    
+    Column-wise reductions then read contiguous memory, and the analyzers share
+    a single conversion instead of each materializing its own copy.
+    """
+    if 'numeric_block' not in ctx:
+        numeric_df = df[ctx['numeric_cols']]
+        arr = numeric_df.to_numpy(dtype=_stats_dtype(numeric_df.dtypes), na_value=np.nan)
+        ctx['numeric_block'] = np.asfortranarray(arr)
+    return ctx['numeric_block']
+
+def generate_summary_stats(df, _ctx=None):
     """Generate summary statistics for the dataset."""
     if df is None or df.empty:
         return None
     
+    ctx = _profile_context(df) if _ctx is None else _ctx
+    
     # Basic info
     n_rows, n_cols = df.shape
     
-    # Missing values
-    na_counts = df.isna().sum()
-    na_percent = (na_counts / n_rows * 100).round(2)
+    # Missing values (computed once and reused for the numeric summary below)
+    na_counts = ctx['na_counts']
+    na_percent = na_counts.mul(100.0 / n_rows).round(2)
     
     # Column types
     dtypes = df.dtypes.astype(str)
     
     # Numeric column stats
-    numeric_cols = df.select_dtypes(include=['number']).columns
+    numeric_cols = ctx['numeric_cols']
     numeric_stats = pd.DataFrame(index=numeric_cols)
     
-    if len(numeric_cols) > 0:
-        numeric_stats['mean'] = df[numeric_cols].mean()
-        numeric_stats['median'] = df[numeric_cols].median()
-        numeric_stats['std'] = df[numeric_cols].std()
-        numeric_stats['min'] = df[numeric_cols].min()
-        numeric_stats['max'] = df[numeric_cols].max()
-    
     # Create a formatted numeric summary dataframe for display
     numeric_summary = None
-    if not numeric_stats.empty:
-        # Create a descriptive stats dataframe
+    if len(numeric_cols) > 0:
+        # A single describe() pass provides every per-column aggregate we report
         numeric_summary = df[numeric_cols].describe().T
+        numeric_stats = numeric_summary[['mean', '50%', 'std', 'min', 'max']].rename(columns={'50%': 'median'})
         # Add additional stats
-        if not numeric_summary.empty:
-            numeric_summary['missing'] = df[numeric_cols].isna().sum()
-            numeric_summary['missing_pct'] = (df[numeric_cols].isna().sum() / len(df) * 100).round(2)
+        numeric_summary['missing'] = na_counts.reindex(numeric_cols).astype('int64')
+        numeric_summary['missing_pct'] = na_percent.reindex(numeric_cols)
     
     # Categorical column stats
-    cat_cols = df.select_dtypes(exclude=['number', 'datetime']).columns
+    nunique = _nunique(df, ctx)
     cat_stats = {}
     
-    for col in cat_cols:
-        if df[col].nunique() < 50:  # Only for columns with reasonable number of categories
-            value_counts = df[col].value_counts().head(10).to_dict()
-            cat_stats[col] = {
-                'count': int(df[col].nunique()),
-                'value_counts': value_counts
-            }
+    # Only for columns with reasonable number of categories
+    for col, count in nunique[nunique < 50].items():
+        value_counts = _top_value_counts(_frame(df, ctx)[col])[0].to_dict()
+        cat_stats[col] = {
+            'count': int(count),
+            'value_counts': value_counts
+        }
     
     # Datetime column stats
-    date_cols = df.select_dtypes(include=['datetime']).columns
     date_stats = {}
     
-    for col in date_cols:
+    for col in ctx['date_cols']:
+        # Each extreme is computed once; NaT means the column is entirely missing
+        col_min, col_max = df[col].min(), df[col].max()
         date_stats[col] = {
-            'min': df[col].min().strftime('%Y-%m-%d %H:%M:%S') if not pd.isna(df[col].min()) else None,
-            'max': df[col].max().strftime('%Y-%m-%d %H:%M:%S') if not pd.isna(df[col].max()) else None
+            'min': col_min.strftime('%Y-%m-%d %H:%M:%S') if not pd.isna(col_min) else None,
+            'max': col_max.strftime('%Y-%m-%d %H:%M:%S') if not pd.isna(col_max) else None
         }
     
     # Compile summary
@@ -76,7 +199,7 @@ def generate_summary_stats(df):
         'missing_values': {col: {'count': int(count), 'percent': float(percent)} 
                            for col, count, percent in zip(df.columns, na_counts, na_percent)},
         'column_types': {col: str(dtype) for col, dtype in zip(df.columns, dtypes)},
-        'numeric_stats': numeric_stats.to_dict() if not numeric_stats.empty else {},
+        'numeric_stats': numeric_stats,
         'numeric_summary': numeric_summary,
         'categorical_stats': cat_stats,
         'datetime_stats': date_stats
@@ -84,394 +207,363 @@ def generate_summary_stats(df):
     
     return summary
 
-def analyze_column_correlations(df, method='pearson'):
+def _gemm_corr(numeric_df, method, block):
+    """Pearson or Spearman correlation of a NaN-free block via one BLAS matmul.
+    
+    Matches DataFrame.corr for complete data: Spearman ranks each column
+    first, and zero-variance columns yield NaN.
+    """
+    if method == 'spearman':
+        a = np.array(numeric_df.rank(), dtype=np.float64)
+    else:
+        a = np.array(block, dtype=np.float64)
+    constant = np.ptp(a, axis=0) == 0
+    a -= a.mean(axis=0)
+    norms = np.sqrt(np.einsum('ij,ij->j', a, a))
+    norms[constant] = np.inf
+    a /= norms
+    corr = a.T @ a
+    np.clip(corr, -1.0, 1.0, out=corr)
+    corr[constant, :] = np.nan
+    corr[:, constant] = np.nan
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
+def analyze_column_correlations(df, method='pearson', _ctx=None):
     """Analyze correlations between numeric columns.
     
     Args:
         df: The DataFrame to analyze
         method: Correlation method ('pearson', 'spearman', or 'kendall')
+        _ctx: Optional shared context from _profile_context
     """
     if df is None or df.empty:
         return None
     
-    numeric_df = df.select_dtypes(include=['number'])
+    ctx = _profile_context(df) if _ctx is None else _ctx
+    
+    numeric_df = df[ctx['numeric_cols']]
     
     if numeric_df.empty or numeric_df.shape[1] < 2:
         return None
     
-    # Calculate correlation matrix
-    corr_matrix = numeric_df.corr(method=method)
-    
-    # Find strongly correlated columns (positive or negative)
-    strong_correlations = []
-    for i in range(len(corr_matrix.columns)):
-        for j in range(i+1, len(corr_matrix.columns)):
-            col1 = corr_matrix.columns[i]
-            col2 = corr_matrix.columns[j]
-            corr_value = corr_matrix.iloc[i, j]
-            
-            if abs(corr_value) > 0.7:  # Consider correlations stronger than 0.7
-                strong_correlations.append({
-                    'column1': col1,
-                    'column2': col2,
-                    'correlation': float(corr_value),
-                    'strength': 'strong positive' if corr_value > 0 else 'strong negative'
-                })
-    
-    # Format top correlations as a DataFrame for easy display
-    top_correlations = pd.DataFrame(strong_correlations)
+    # Calculate correlation matrix; without missing values no pairwise deletion
+    # is needed, so pearson/spearman reduce to one matrix product
+    if method in ('pearson', 'spearman') and not ctx['na_counts'][numeric_df.columns].any():
+        corr_matrix = _gemm_corr(numeric_df, method, _numeric_block(df, ctx))
+    else:
+        corr_matrix = numeric_df.corr(method=method)
+    
+    # Find strongly correlated columns (positive or negative) in the upper triangle;
+    # consider correlations stronger than 0.7
+    corr_values = corr_matrix.to_numpy()
+    ii, jj = np.nonzero(np.triu(np.abs(corr_values) > 0.7, k=1))
+    vals = corr_values[ii, jj]
+    cols = corr_matrix.columns
+    
+    # Format top correlations as a DataFrame for easy display, built column-wise
+    top_correlations = pd.DataFrame({
+        'column1': cols[ii],
+        'column2': cols[jj],
+        'correlation': vals.astype(np.float64),
+        'strength': np.where(vals > 0, 'strong positive', 'strong negative'),
+    })
     
     return {
         'correlation_matrix': corr_matrix,
-        'strong_correlations': strong_correlations,
-        'top_correlations': top_correlations if not top_correlations.empty else pd.DataFrame(columns=['column1', 'column2', 'correlation', 'strength'])
+        'strong_correlations': top_correlations.to_dict('records'),
+        'top_correlations': top_correlations
     }
 
-def detect_outliers(df, method='zscore', threshold=3.0):
+def _stats_dtype(dtypes):
+    """Pick the float dtype for a numeric block's statistical sweeps.
+    
+    float32 halves the memory traffic of the reductions, but is only used when
+    every column (e.g. float32, int16) converts to it exactly; otherwise float64.
+    """
+    dtype = np.result_type(np.float32, *[getattr(dt, 'numpy_dtype', dt) for dt in dtypes])
+    return dtype if dtype == np.float32 else np.dtype(np.float64)
+
+def _zscore_outlier_mask(arr, threshold):
+    """Flag values whose absolute column Z-score exceeds threshold.
+    
+    Uses the population standard deviation, as scipy.stats.zscore does, and
+    works in a single scratch buffer so the block is only copied once.
+    """
+    mu = np.nanmean(arr, axis=0)
+    sigma = np.nanstd(arr, axis=0)
+    z = np.subtract(arr, mu)
+    np.abs(z, out=z)
+    np.divide(z, sigma, out=z)
+    return z > threshold
+
+def _outlier_mask(arr, method, threshold):
+    """Flag outliers column by column in a float block using the given method."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'zscore':
+            # Calculate Z-scores
+            return _zscore_outlier_mask(arr, threshold)
+        
+        if method == 'iqr':
+            # Use Interquartile Range method
+            q1, q3 = np.nanpercentile(arr, [25, 75], axis=0)
+            iqr = q3 - q1
+            lower_bound = q1 - (threshold * iqr)
+            upper_bound = q3 + (threshold * iqr)
+            return (arr < lower_bound) | (arr > upper_bound)
+        
+        # Modified Z-score using median
+        median = np.nanmedian(arr, axis=0)
+        deviation = np.abs(arr - median)
+        mad = np.nanmedian(deviation, axis=0)
+        # Columns with zero MAD are skipped to avoid division by zero
+        return (0.6745 * deviation / mad > threshold) & (mad > 0)
+
+def _parallel_outlier_mask(arr, method, threshold):
+    """Run _outlier_mask over column chunks in a thread pool for wide blocks.
+    
+    The NumPy reductions release the GIL, so chunks of a few columns scale
+    across cores; narrow blocks are scored in one call.
+    """
+    n_cols = arr.shape[1]
+    if n_cols <= _PARALLEL_MIN_COLUMNS:
+        return _outlier_mask(arr, method, threshold)
+    chunks = [arr[:, i:i + _COLUMN_CHUNK] for i in range(0, n_cols, _COLUMN_CHUNK)]
+    with ThreadPoolExecutor() as executor:
+        masks = executor.map(lambda chunk: _outlier_mask(chunk, method, threshold), chunks)
+        return np.hstack(list(masks))
+
+def detect_outliers(df, method='zscore', threshold=3.0, _ctx=None):
     """Detect outliers in numeric columns.
     
     Args:
         df: The DataFrame to analyze
         method: The method to use for outlier detection ('zscore', 'iqr', or 'modified_zscore')
         threshold: The threshold value for identifying outliers
+        _ctx: Optional shared context from _profile_context
     """
     if df is None or df.empty:
         return None
     
-    numeric_df = df.select_dtypes(include=['number'])
+    ctx = _profile_context(df) if _ctx is None else _ctx
+    
+    numeric_df = df[ctx['numeric_cols']]
+    na_counts = ctx['na_counts']
     
     if numeric_df.empty:
         return None
     
-    outliers = {}
+    # Skip columns with too many missing values or too few values to judge
+    n_valid = len(df) - na_counts[numeric_df.columns]
+    eligible = (na_counts[numeric_df.columns] <= 0.5 * len(df)) & (n_valid >= 5)
+    keep = eligible.to_numpy()
+    numeric_df = numeric_df.loc[:, keep]
     
-    for column in numeric_df.columns:
-        # Skip columns with too many missing values
-        if df[column].isna().sum() > 0.5 * len(df):
-            continue
-        
-        # Get non-missing values
-        values = df[column].dropna()
-        
-        # Skip if too few values
-        if len(values) < 5:
-            continue
-        
-        # Detect outliers based on selected method
-        outlier_indices = []
-        
-        if method == 'zscore':
-            # Calculate Z-scores
-            z_scores = np.abs(stats.zscore(values))
-            outlier_indices = np.where(z_scores > threshold)[0]
-            
-        elif method == 'iqr':
-            # Use Interquartile Range method
-            q1 = values.quantile(0.25)
-            q3 = values.quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - (threshold * iqr)
-            upper_bound = q3 + (threshold * iqr)
-            outlier_indices = values[(values < lower_bound) | (values > upper_bound)].index
-            
-        elif method == 'modified_zscore':
-            # Modified Z-score using median
-            median = values.median()
-            mad = np.median(np.abs(values - median))
-            if mad > 0:  # Avoid division by zero
-                modified_z_scores = 0.6745 * np.abs(values - median) / mad
-                outlier_indices = values[modified_z_scores > threshold].index
-        
-        # Store outliers if any were found
-        if len(outlier_indices) > 0:
-            # For 'zscore' method, we need to map back to the original indices
-            if method == 'zscore':
-                original_indices = values.index[outlier_indices]
-                outlier_values = values.iloc[outlier_indices].values
-            else:
-                original_indices = outlier_indices
-                outlier_values = values.loc[outlier_indices].values
-            
-            outliers[column] = {
-                'count': len(outlier_indices),
-                'percent': len(outlier_indices) / len(df) * 100,
-                'indices': original_indices.tolist(),
-                'values': outlier_values.tolist()
-            }
+    outliers = {}
+    if numeric_df.shape[1] == 0:
+        return outliers
+    
+    # Score every eligible column at once on a single float block; NaNs never flag
+    arr = _numeric_block(df, ctx)
+    if not keep.all():
+        arr = arr[:, keep]
+    
+    if method not in ('zscore', 'iqr', 'modified_zscore'):
+        return outliers
+    
+    mask = _parallel_outlier_mask(arr, method, threshold)
+    
+    # Store outliers for the columns where any were found
+    counts = mask.sum(axis=0)
+    for j in np.flatnonzero(counts):
+        rows = np.flatnonzero(mask[:, j])
+        count = int(counts[j])
+        outliers[numeric_df.columns[j]] = {
+            'count': count,
+            'percent': count / len(df) * 100,
+            'indices': df.index[rows].tolist(),
+            'values': numeric_df.iloc[rows, j].tolist()
+        }
     
     return outliers
 
-def generate_quick_eda_report(df):
-    """Generate a quick EDA report with custom HTML."""
+def _render_eda_report(df):
+    """Run every analyzer on df and render the report as base64-encoded HTML."""
+    # Column groupings and counts shared by all of the analyzers below
+    ctx = _profile_context(df)
+    
+    # Generate summary statistics
+    summary_stats = generate_summary_stats(df, ctx)
+    
+    # Get correlation information
+    correlations = analyze_column_correlations(df, _ctx=ctx)
+    
+    # Get outlier information
+    outliers = detect_outliers(df, _ctx=ctx)
+    
+    # Get skewness information
+    skewness = detect_skewness(df, ctx)
+    
+    # Get categorical distributions
+    cat_distributions = analyze_categorical_distributions(df, ctx)
+    
+    # Render each section as a table, then fill the report template once
+    missing = summary_stats['missing_values'].values()
+    column_types = pd.DataFrame({
+        'Column': list(summary_stats['column_types']),
+        'Type': list(summary_stats['column_types'].values()),
+        'Missing Values': [m['count'] for m in missing],
+        'Missing %': [m['percent'] for m in missing],
+    })
+    sections = [('Column Types', _html_table(column_types, formatters={'Missing %': '{:.2f}%'.format}))]
+    
+    # Add numeric statistics if available
+    numeric_stats = summary_stats['numeric_stats']
+    if not numeric_stats.empty:
+        numeric_table = (numeric_stats[['mean', 'median', 'std', 'min', 'max']]
+                         .rename(columns=str.capitalize)
+                         .rename_axis('Column')
+                         .reset_index())
+        sections.append(('Numeric Columns Statistics', _html_table(numeric_table, float_format='{:.2f}'.format)))
+    
+    # Add correlation information if available
+    if correlations and correlations.get('strong_correlations'):
+        corr_table = correlations['top_correlations'].rename(columns={
+            'column1': 'Column 1',
+            'column2': 'Column 2',
+            'correlation': 'Correlation',
+            'strength': 'Strength',
+        })
+        sections.append(('Strong Correlations', _html_table(corr_table, formatters={'Correlation': '{:.3f}'.format})))
+    
+    # Add outlier information if available
+    if outliers:
+        outlier_table = pd.DataFrame({
+            'Column': list(outliers),
+            'Count': [details['count'] for details in outliers.values()],
+            'Percentage': [details['percent'] for details in outliers.values()],
+        })
+        sections.append(('Outliers', _html_table(outlier_table, formatters={'Percentage': '{:.2f}%'.format})))
+    
+    # Add skewness information if available
+    if skewness:
+        skew_table = (pd.DataFrame.from_dict(skewness, orient='index')
+                      .rename(columns={'skewness': 'Skewness Value', 'direction': 'Direction', 'severity': 'Severity'})
+                      .rename_axis('Column')
+                      .reset_index())
+        sections.append(('Skewed Distributions', _html_table(skew_table, formatters={'Skewness Value': '{:.3f}'.format})))
+    
+    html = _REPORT_TEMPLATE.render(
+        rows=summary_stats['basic_info']['rows'],
+        columns=summary_stats['basic_info']['columns'],
+        sections=sections,
+    )
+    
+    # Convert to base64 for embedding
+    report_base64 = base64.b64encode(html.encode()).decode()
+    
+    return report_base64
+
+# Reports are keyed on a caller-supplied identity of the frame; hashing the
+# frame itself would cost more than most of the analyzers it skips
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def _cached_eda_report(cache_key, _df):
+    return _render_eda_report(_df)
+
+def generate_quick_eda_report(df, cache_key=None):
+    """Generate a quick EDA report with custom HTML.
+    
+    Args:
+        df: The DataFrame to profile
+        cache_key: Optional cheap, hashable identity of df (such as the dataset
+            id and revision); when given, the rendered report is reused
+    """
     if df is None or df.empty:
         return None
     
     try:
-        # Generate summary statistics
-        summary_stats = generate_summary_stats(df)
-        
-        # Get correlation information
-        correlations = analyze_column_correlations(df)
-        
-        # Get outlier information
-        outliers = detect_outliers(df)
-        
-        # Get skewness information
-        skewness = detect_skewness(df)
-        
-        # Get categorical distributions
-        cat_distributions = analyze_categorical_distributions(df)
-        
-        # Create HTML report with double quotes for CSS properties
-        html = f"""
-        <html>
-        <head>
-            <title>Dataset Profile Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1, h2, h3 {{ color: #2c3e50; }}
-                .section {{ margin-bottom: 30px; }}
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ text-align: left; padding: 8px; border-bottom: 1px solid #ddd; }}
-                th {{ background-color: #f2f2f2; }}
-                tr:hover {{ background-color: #f5f5f5; }}
-                .stat-card {{ 
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    padding: 15px;
-                    margin-bottom: 15px;
-                    background-color: #f9f9f9;
-                }}
-            </style>
-        </head>
-        <body>
-            <h1>Dataset Profile Report</h1>
-            
-            <div class="section">
-                <h2>Dataset Overview</h2>
-                <div class="stat-card">
-                    <p><strong>Rows:</strong> {summary_stats['basic_info']['rows']}</p>
-                    <p><strong>Columns:</strong> {summary_stats['basic_info']['columns']}</p>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>Column Types</h2>
-                <table>
-                    <tr>
-                        <th>Column</th>
-                        <th>Type</th>
-                        <th>Missing Values</th>
-                        <th>Missing %</th>
-                    </tr>
-        """
-        
-        # Add column type information
-        for col, dtype in summary_stats['column_types'].items():
-            missing_count = summary_stats['missing_values'][col]['count']
-            missing_percent = summary_stats['missing_values'][col]['percent']
-            html += f"""
-                    <tr>
-                        <td>{col}</td>
-                        <td>{dtype}</td>
-                        <td>{missing_count}</td>
-                        <td>{missing_percent:.2f}%</td>
-                    </tr>
-            """
-        
-        html += """
-                </table>
-            </div>
-        """
-        
-        # Add numeric statistics if available
-        if summary_stats['numeric_stats']:
-            html += """
-            <div class="section">
-                <h2>Numeric Columns Statistics</h2>
-                <table>
-                    <tr>
-                        <th>Column</th>
-                        <th>Mean</th>
-                        <th>Median</th>
-                        <th>Std</th>
-                        <th>Min</th>
-                        <th>Max</th>
-                    </tr>
-            """
-            
-            for col in summary_stats['numeric_stats'].get('mean', {}).keys():
-                mean = summary_stats['numeric_stats']['mean'].get(col, 'N/A')
-                median = summary_stats['numeric_stats']['median'].get(col, 'N/A')
-                std = summary_stats['numeric_stats']['std'].get(col, 'N/A')
-                min_val = summary_stats['numeric_stats']['min'].get(col, 'N/A')
-                max_val = summary_stats['numeric_stats']['max'].get(col, 'N/A')
-                
-                html += f"""
-                        <tr>
-                            <td>{col}</td>
-                            <td>{f"{mean:.2f}" if isinstance(mean, (int, float)) else mean}</td>
-                            <td>{f"{median:.2f}" if isinstance(median, (int, float)) else median}</td>
-                            <td>{f"{std:.2f}" if isinstance(std, (int, float)) else std}</td>
-                            <td>{f"{min_val:.2f}" if isinstance(min_val, (int, float)) else min_val}</td>
-                            <td>{f"{max_val:.2f}" if isinstance(max_val, (int, float)) else max_val}</td>
-                        </tr>
-                """
-            
-            html += """
-                </table>
-            </div>
-            """
-        
-        # Add correlation information if available
-        if correlations and correlations.get('strong_correlations'):
-            html += """
-            <div class="section">
-                <h2>Strong Correlations</h2>
-                <table>
-                    <tr>
-                        <th>Column 1</th>
-                        <th>Column 2</th>
-                        <th>Correlation</th>
-                        <th>Strength</th>
-                    </tr>
-            """
-            
-            for corr in correlations['strong_correlations']:
-                html += f"""
-                        <tr>
-                            <td>{corr['column1']}</td>
-                            <td>{corr['column2']}</td>
-                            <td>{corr['correlation']:.3f}</td>
-                            <td>{corr['strength']}</td>
-                        </tr>
-                """
-            
-            html += """
-                </table>
-            </div>
-            """
-        
-        # Add outlier information if available
-        if outliers:
-            html += """
-            <div class="section">
-                <h2>Outliers</h2>
-                <table>
-                    <tr>
-                        <th>Column</th>
-                        <th>Count</th>
-                        <th>Percentage</th>
-                    </tr>
-            """
-            
-            for col, details in outliers.items():
-                html += f"""
-                        <tr>
-                            <td>{col}</td>
-                            <td>{details['count']}</td>
-                            <td>{details['percent']:.2f}%</td>
-                        </tr>
-                """
-            
-            html += """
-                </table>
-            </div>
-            """
-        
-        # Add skewness information if available
-        if skewness:
-            html += """
-            <div class="section">
-                <h2>Skewed Distributions</h2>
-                <table>
-                    <tr>
-                        <th>Column</th>
-                        <th>Skewness Value</th>
-                        <th>Direction</th>
-                        <th>Severity</th>
-                    </tr>
-            """
-            
-            for col, details in skewness.items():
-                html += f"""
-                        <tr>
-                            <td>{col}</td>
-                            <td>{details['skewness']:.3f}</td>
-                            <td>{details['direction']}</td>
-                            <td>{details['severity']}</td>
-                        </tr>
-                """
-            
-            html += """
-                </table>
-            </div>
-            """
-        
-        # Close the HTML document
-        html += """
-        </body>
-        </html>
-        """
-        
-        # Convert to base64 for embedding
-        report_base64 = base64.b64encode(html.encode()).decode()
-        
-        return report_base64
+        if cache_key is None:
+            return _render_eda_report(df)
+        return _cached_eda_report(cache_key, df)
     except Exception as e:
         st.error(f"Failed to generate EDA report: {str(e)}")
         return None
 
-def detect_skewness(df):
+def detect_skewness(df, _ctx=None):
     """Detect skewed distributions in numeric columns."""
     if df is None or df.empty:
         return None
     
-    numeric_df = df.select_dtypes(include=['number'])
+    ctx = _profile_context(df) if _ctx is None else _ctx
+    
+    numeric_df = df[ctx['numeric_cols']]
+    na_counts = ctx['na_counts']
     
     if numeric_df.empty:
         return None
     
+    # Skip columns with too many missing values
+    eligible = na_counts[numeric_df.columns] <= 0.5 * len(df)
+    
+    # Calculate skewness for all eligible columns in one call
+    skew_all = numeric_df.loc[:, eligible.to_numpy()].skew()
+    
+    # Consider values with abs(skew) > 0.5 as skewed
+    skewed = skew_all[skew_all.abs() > 0.5]
+    
     skewness = {}
     
-    for column in numeric_df.columns:
-        # Skip columns with too many missing values
-        if df[column].isna().sum() > 0.5 * len(df):
-            continue
-        
-        # Calculate skewness
-        skew_value = df[column].skew()
-        
-        if abs(skew_value) > 0.5:  # Consider values with abs(skew) > 0.5 as skewed
-            skewness[column] = {
-                'skewness': float(skew_value),
-                'direction': 'right' if skew_value > 0 else 'left',
-                'severity': 'high' if abs(skew_value) > 1 else 'moderate'
-            }
+    for column, skew_value in skewed.items():
+        skewness[column] = {
+            'skewness': float(skew_value),
+            'direction': 'right' if skew_value > 0 else 'left',
+            'severity': 'high' if abs(skew_value) > 1 else 'moderate'
+        }
     
     return skewness
 
-def analyze_categorical_distributions(df):
+def _top_value_counts(series, n=10):
+    """Return the n most frequent values and the total non-missing count.
+    
+    Counts come from np.bincount over categorical codes (other columns are
+    factorized first) and only the top n are sorted, via np.partition. Ties
+    keep first-appearance order, as Series.value_counts does.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, categories = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, categories = pd.factorize(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    if n < len(counts):
+        # Everything above the n-th largest count, topped up with the earliest ties
+        kth = np.partition(counts, -n)[-n]
+        above = np.flatnonzero(counts > kth)
+        ties = np.flatnonzero(counts == kth)[:n - len(above)]
+        top = np.sort(np.concatenate([above, ties]))
+    else:
+        top = np.arange(len(counts))
+    top = top[np.argsort(-counts[top], kind='stable')]
+    return pd.Series(counts[top], index=categories[top]), int(counts.sum())
+
+def analyze_categorical_distributions(df, _ctx=None):
     """Analyze the distribution of categorical columns."""
     if df is None or df.empty:
         return None
     
+    ctx = _profile_context(df) if _ctx is None else _ctx
+    
     # Consider both categorical and object types
-    cat_columns = df.select_dtypes(include=['category', 'object']).columns
+    cat_columns = ctx['object_cols']
     
     if len(cat_columns) == 0:
         return None
     
+    # Skip columns with too many unique values before touching their data
+    nunique = _nunique(df, ctx)[cat_columns]
     cat_distributions = {}
     
-    for column in cat_columns:
-        # Skip if too many unique values
-        if df[column].nunique() > 50:
-            continue
-        
+    for column in nunique.index[nunique <= 50]:
         # Get value counts and calculate percentages
-        value_counts = df[column].value_counts()
-        total_count = value_counts.sum()
+        value_counts, total_count = _top_value_counts(_frame(df, ctx)[column])
         percentages = (value_counts / total_count * 100).round(2)
         
         # Check for imbalanced categories (if one category is much more frequent)
@@ -485,9 +577,9 @@ def analyze_categorical_distributions(df):
                 dominant_category = percentages.idxmax()
         
         cat_distributions[column] = {
-            'unique_values': int(df[column].nunique()),
-            'top_categories': dict(zip(value_counts.index[:10].astype(str), value_counts.values[:10])),
-            'top_percentages': dict(zip(percentages.index[:10].astype(str), percentages.values[:10])),
+            'unique_values': int(nunique[column]),
+            'top_categories': dict(zip(value_counts.index.astype(str), value_counts.values)),
+            'top_percentages': dict(zip(percentages.index.astype(str), percentages.values)),
             'is_imbalanced': is_imbalanced,
             'dominant_category': str(dominant_category) if dominant_category is not None else None
         }
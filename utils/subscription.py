@@ -1,7 +1,10 @@
 import streamlit as st
 import datetime
+import logging
 from datetime import timedelta
 
+logger = logging.getLogger(__name__)
+
 # Subscription plans data for UI display
 SUBSCRIPTION_PLANS = {
     "free": {
@@ -97,7 +100,7 @@ def get_trial_days_remaining(trial_end_date_str=None):
         days_left = (trial_end_date - today).days
         return max(0, days_left)
     except Exception as e:
-        print(f"Error calculating trial days: {e}")
+        logger.debug("Error calculating trial days: %s", e)
         return 0
 
 def get_subscription_expires_in_days(subscription_end_date_str=None):
@@ -120,5 +123,5 @@ def get_subscription_expires_in_days(subscription_end_date_str=None):
         days_left = (subscription_end_date - today).days
         return max(0, days_left)
     except Exception as e:
-        print(f"Error calculating subscription days: {e}")
+        logger.debug("Error calculating subscription days: %s", e)
         return 0
\ No newline at end of file